@@ -1,6 +1,5 @@
 from django.test import override_settings
 
-import pytest
 from rest_framework import status
 
 from thenewboston_node.business_logic.models import Block, NodeDeclarationSignedChangeRequest
@@ -18,27 +17,19 @@ def test_memory_blockchain_supported(api_client, memory_blockchain, primary_vali
     assert response.status_code == status.HTTP_200_OK
 
 
-@pytest.mark.parametrize('block_number', (-2, 'invalid_id', 0, 999))
-def test_invalid_block_number_returns_400(api_client, file_blockchain, block_number):
-    with force_blockchain(file_blockchain), as_primary_validator():
-        response = api_client.get(API_V1_BLOCKCHAIN_STATE_URL_PATTERN.format(block_number=block_number))
-
-    assert response.status_code == status.HTTP_404_NOT_FOUND
+def test_invalid_block_number_returns_400(api_client, shared_file_blockchain):
+    with force_blockchain(shared_file_blockchain), as_primary_validator():
+        for block_number in (-2, 'invalid_id', 0, 999):
+            response = api_client.get(API_V1_BLOCKCHAIN_STATE_URL_PATTERN.format(block_number=block_number))
+            assert response.status_code == status.HTTP_404_NOT_FOUND, f'block_number={block_number!r}'
 
 
-@pytest.mark.parametrize('block_number', ('-1', 'null', 'genesis', ' null '))
 def test_can_get_blockchain_genesis_state_meta(
-    api_client, file_blockchain, blockchain_genesis_state, block_number, pv_network_address
+    api_client, shared_file_blockchain, shared_blockchain_genesis_state, pv_network_address
 ):
-    with force_blockchain(file_blockchain), as_primary_validator():
-        response = api_client.get(API_V1_BLOCKCHAIN_STATE_URL_PATTERN.format(block_number=block_number))
-
-    assert response.status_code == status.HTTP_200_OK
-    response_json = response.json()
-
-    assert response_json == {
+    expected_response_json = {
         'last_block_number':
-            blockchain_genesis_state.last_block_number,
+            shared_blockchain_genesis_state.last_block_number,
         'url_path':
             '/blockchain/blockchain-states/0/0/0/0/0/0/0/0/0000000000000000000!-blockchain-state.msgpack.gz',
         'urls': [
@@ -47,6 +38,12 @@ def test_can_get_blockchain_genesis_state_meta(
         ]
     }
 
+    with force_blockchain(shared_file_blockchain), as_primary_validator():
+        for block_number in ('-1', 'null', 'genesis', ' null '):
+            response = api_client.get(API_V1_BLOCKCHAIN_STATE_URL_PATTERN.format(block_number=block_number))
+            assert response.status_code == status.HTTP_200_OK, f'block_number={block_number!r}'
+            assert response.json() == expected_response_json, f'block_number={block_number!r}'
+
 
 def test_blockchain_state_meta_block_number_is_inclusive(api_client, file_blockchain, preferred_node_key_pair):
     with force_blockchain(file_blockchain), as_primary_validator():
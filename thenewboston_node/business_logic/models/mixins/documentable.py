@@ -1,3 +1,4 @@
+import functools
 import json
 import textwrap
 import typing
@@ -12,7 +13,7 @@ from thenewboston_node.core.utils.types import hexstr
 
 from .base import BaseMixin
 
-TYPE_NAME_MAP = {
+TYPE_NAME_MAP: dict[typing.Any, str] = {
     str: 'string',
     hexstr: 'hexstr',
     int: 'integer',
@@ -23,118 +24,172 @@ TYPE_NAME_MAP = {
     typing.Any: 'any type',
 }
 
+_ATTRIBUTE_DOCS_CACHE: dict[type, dict] = {}
+_NESTED_MODELS_CACHE: dict[type, tuple[type, ...]] = {}
+_HUMANIZED_FIELD_NAMES_CACHE: dict[type, dict[str, str]] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _extract_docs_single(cls):
+    return class_doc.extract_docs_from_cls_obj(cls=cls)
+
 
 def extract_attribute_docs(model):
     docs = {}
-    for class_ in reversed(model.mro()):
-        if class_ is not object:
-            docs |= class_doc.extract_docs_from_cls_obj(cls=class_)
+    # Skip `object` which is always the last class in MRO
+    for class_ in model.__mro__[-2::-1]:
+        docs.update(_extract_docs_single(class_))
 
-    return docs
+    return {field_name: textwrap.dedent(' '.join(docstrings)) for field_name, docstrings in docs.items()}
 
 
-def normalize_type_representation(type_, jsonify=True, targetized_types=(hexstr, datetime)):
-    type_name = (TYPE_NAME_MAP.get(type_) or type_.__name__) if jsonify else type_.__name__
-    if isclass(type_) and issubclass(type_, targetized_types + (DocumentableMixin,)):
-        type_name = f'`{type_name}`_'
+def _is_list_origin(origin):
+    # Identity check is the fast path for `list[...]` and `typing.List[...]`, `issubclass()` is for `list` subclasses
+    return origin is list or (isclass(origin) and issubclass(origin, list))
 
-    return type_name
+
+def _is_dict_origin(origin):
+    return origin is dict or (isclass(origin) and issubclass(origin, dict))
+
+
+def _collect_nested_models(cls, seen: set, order: list):
+    seen.add(cls)
+    order.append(cls)
+
+    for subtypes in cls._get_field_subtypes():
+        for subtype in subtypes:
+            if issubclass(subtype, DocumentableMixin) and subtype not in seen:
+                _collect_nested_models(subtype, seen, order)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_field_type_representation(cls, field_name, jsonify):
+    field_type = cls.get_field_type(field_name)
+
+    origin = typing.get_origin(field_type)
+    if _is_list_origin(origin):
+        (item_type,) = typing.get_args(field_type)
+        return (
+            f'{normalize_type_representation(list, jsonify=jsonify)}'
+            f'[{normalize_type_representation(item_type, jsonify=jsonify)}]'
+        )
+    elif _is_dict_origin(origin):
+        item_key_type, item_value_type = typing.get_args(field_type)
+        return (
+            f'{normalize_type_representation(dict, jsonify=jsonify)}'
+            f'[{normalize_type_representation(item_key_type, jsonify=jsonify)}, '
+            f'{normalize_type_representation(item_value_type, jsonify=jsonify)}]'
+        )
+
+    return normalize_type_representation(field_type, jsonify=jsonify)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_docstring(cls, use_humanized_default):
+    doc = getdoc(cls)
+    if doc is None and use_humanized_default:
+        doc = humanize_camel_case(cls.__name__)
+
+    return doc
+
+
+def _get_humanized_field_names(cls):
+    humanized_field_names = _HUMANIZED_FIELD_NAMES_CACHE.get(cls)
+    if humanized_field_names is None:
+        humanized_field_names = _HUMANIZED_FIELD_NAMES_CACHE[cls] = {
+            field_name: humanize_snake_case(field_name) for field_name in cls.get_field_names()
+        }
+
+    return humanized_field_names
+
+
+@functools.lru_cache(maxsize=None)
+def _get_field_docstring(cls, field_name, imply_field_name):
+    attribute_docs = _ATTRIBUTE_DOCS_CACHE.get(cls)
+    if attribute_docs is None:
+        attribute_docs = _ATTRIBUTE_DOCS_CACHE[cls] = extract_attribute_docs(cls)
+
+    if docstring := attribute_docs.get(field_name):
+        return docstring
+    elif imply_field_name:
+        return _get_humanized_field_names(cls).get(field_name) or humanize_snake_case(field_name)
+
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_field_example_value_raw(cls, field_name):
+    # We use `SENTINEL` here because theoretically `None` can be an example value (although it is unlikely)
+    return cls.get_field_metadata(field_name).get('example_value', SENTINEL)
 
 
-def default_serialize(obj):
-    if isinstance(obj, (date, datetime)):
-        return obj.isoformat()
+def _resolve_dates(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    elif isinstance(value, dict):
+        return {key: _resolve_dates(item_value) for key, item_value in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [_resolve_dates(item) for item in value]
+
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _get_field_example_value_json(cls, field_name):
+    # Example values are static, so we resolve dates once here instead of passing `default=` to `json.dumps()`
+    return json.dumps(_resolve_dates(_get_field_example_value_raw(cls, field_name)))
 
 
 class DocumentableMixin(BaseMixin):
-    attribute_docs = None
 
     @classmethod
-    def get_nested_models(cls, known_models=(), include_self=False):
-        assert cls not in known_models
-        known_models = known_models or []
-        if include_self:
-            known_models.append(cls)
-
+    @functools.lru_cache(maxsize=None)
+    def _get_field_subtypes(cls) -> tuple[tuple[type, ...], ...]:
+        """
+        Return classes that may require traversal for each field.
+        """
+        field_subtypes = []
         for field_name in cls.get_field_names():
             field_type = cls.get_field_type(field_name)
-            if issubclass(field_type, DocumentableMixin) and field_type not in known_models:
-                known_models = field_type.get_nested_models(known_models, include_self=True)
+            origin = typing.get_origin(field_type)
+            if _is_list_origin(origin) or _is_dict_origin(origin):
+                subtypes = typing.get_args(field_type)
             else:
-                origin = typing.get_origin(field_type)
-                if origin and issubclass(origin, list):
-                    (item_type,) = typing.get_args(field_type)
-                    if issubclass(item_type, DocumentableMixin) and item_type not in known_models:
-                        known_models = item_type.get_nested_models(known_models, include_self=True)
-                elif origin and issubclass(origin, dict):
-                    item_key_type, item_value_type = typing.get_args(field_type)
-                    if (
-                        isclass(item_key_type) and issubclass(item_key_type, DocumentableMixin) and
-                        item_key_type not in known_models
-                    ):
-                        known_models = item_key_type.get_nested_models(known_models, include_self=True)
-                    if (
-                        isclass(item_value_type) and issubclass(item_value_type, DocumentableMixin) and
-                        item_value_type not in known_models
-                    ):
-                        known_models = item_value_type.get_nested_models(known_models, include_self=True)
-
-        return known_models
+                subtypes = (field_type,)
 
-    @classmethod
-    def get_docstring(cls, use_humanized_default=True):
-        doc = getdoc(cls)
-        if doc is None and use_humanized_default:
-            doc = humanize_camel_case(cls.__name__)
+            field_subtypes.append(tuple(subtype for subtype in subtypes if isclass(subtype)))
 
-        return doc
+        return tuple(field_subtypes)
 
     @classmethod
-    def get_field_docstring(cls, field_name, imply_field_name=True):
-        if (attribute_docs := cls.attribute_docs) is None:
-            cls.attribute_docs = attribute_docs = extract_attribute_docs(cls)
+    def get_nested_models(cls, *, include_self=False) -> tuple[type, ...]:
+        if (nested_models := _NESTED_MODELS_CACHE.get(cls)) is None:
+            order: list[type] = []
+            _collect_nested_models(cls, set(), order)
+            nested_models = _NESTED_MODELS_CACHE[cls] = tuple(order)
 
-        docstrings = attribute_docs.get(field_name)
-        if docstrings:
-            return textwrap.dedent(' '.join(docstrings))
-        elif imply_field_name:
-            return humanize_snake_case(field_name)
+        # `cls` is always the first item, because it is the traversal starting point
+        return nested_models if include_self else nested_models[1:]
 
-        return None
+    @classmethod
+    def get_docstring(cls, use_humanized_default=True):
+        return _get_docstring(cls, use_humanized_default)
+
+    @classmethod
+    def get_field_docstring(cls, field_name, imply_field_name=True):
+        return _get_field_docstring(cls, field_name, imply_field_name)
 
     @classmethod
     def get_field_type_representation(cls, field_name, jsonify=True):
-        field_type = cls.get_field_type(field_name)
-
-        origin = typing.get_origin(field_type)
-        if origin:
-            if issubclass(origin, list):
-                (item_type,) = typing.get_args(field_type)
-                return (
-                    f'{normalize_type_representation(list, jsonify=jsonify)}'
-                    f'[{normalize_type_representation(item_type, jsonify=jsonify)}]'
-                )
-            elif issubclass(origin, dict):
-                item_key_type, item_value_type = typing.get_args(field_type)
-                return (
-                    f'{normalize_type_representation(dict, jsonify=jsonify)}'
-                    f'[{normalize_type_representation(item_key_type, jsonify=jsonify)}, '
-                    f'{normalize_type_representation(item_value_type, jsonify=jsonify)}]'
-                )
-
-        return normalize_type_representation(field_type, jsonify=jsonify)
+        return _get_field_type_representation(cls, field_name, jsonify)
 
     @classmethod
     def get_field_example_value(cls, field_name, jsonify=True):
-        # We use `SENTINEL` here because theoretically `None` can be an example value (although it is unlikely)
-        value = cls.get_field_metadata(field_name).get('example_value', SENTINEL)
+        value = _get_field_example_value_raw(cls, field_name)
         if value is SENTINEL:
             return None
 
-        if jsonify:
-            value = json.dumps(value, default=default_serialize)
-
-        return value
+        return _get_field_example_value_json(cls, field_name) if jsonify else value
 
     @classmethod
     def is_serialized_optional_field(cls, field_name):
@@ -145,3 +200,24 @@ class DocumentableMixin(BaseMixin):
         # TODO(dmu) LOW: Consider using this method for validation
         value = cls.get_field_metadata(field_name).get('is_serialized_optional')
         return cls.is_optional_field(field_name) if value is None else value
+
+
+_DEFAULT_TARGETIZED_TYPES = (hexstr, datetime, DocumentableMixin)
+_JSONIFIED_TYPE_NAME_MAP = {
+    type_: f'`{type_name}`_' if isclass(type_) and issubclass(type_, _DEFAULT_TARGETIZED_TYPES) else type_name
+    for type_, type_name in TYPE_NAME_MAP.items()
+}
+
+
+@functools.lru_cache(maxsize=None)
+def normalize_type_representation(type_, jsonify=True, targetized_types=_DEFAULT_TARGETIZED_TYPES):
+    if jsonify and targetized_types is _DEFAULT_TARGETIZED_TYPES:
+        # Fast path for the most common types
+        if (type_name := _JSONIFIED_TYPE_NAME_MAP.get(type_)) is not None:
+            return type_name
+
+    type_name = (TYPE_NAME_MAP.get(type_) or type_.__name__) if jsonify else type_.__name__
+    if isclass(type_) and issubclass(type_, targetized_types):
+        type_name = f'`{type_name}`_'
+
+    return type_name
@@ -66,8 +66,7 @@ def memory_blockchain(blockchain_genesis_state):
     yield blockchain
 
 
-@pytest.fixture
-def file_blockchain(blockchain_genesis_state, blockchain_directory):
+def make_file_blockchain(blockchain_genesis_state, blockchain_directory):
     blockchain = FileBlockchain(
         base_directory=blockchain_directory,
         blockchain_state_storage_kwargs={
@@ -84,7 +83,21 @@ def file_blockchain(blockchain_genesis_state, blockchain_directory):
     blockchain._test_primary_validator_key_pair = blockchain_genesis_state._test_primary_validator_key_pair
     blockchain._test_confirmation_validator_key_pair = blockchain_genesis_state._test_confirmation_validator_key_pair
     blockchain.validate()
-    yield blockchain
+    return blockchain
+
+
+@pytest.fixture
+def file_blockchain(blockchain_genesis_state, blockchain_directory):
+    yield make_file_blockchain(blockchain_genesis_state, blockchain_directory)
+
+
+@pytest.fixture(scope='module')
+def shared_file_blockchain(shared_blockchain_genesis_state, shared_blockchain_directory):
+    """
+    Read-only file blockchain shared by tests of a module to avoid building it for every test.
+    Tests that modify blockchain must use `file_blockchain` fixture instead.
+    """
+    yield make_file_blockchain(shared_blockchain_genesis_state, shared_blockchain_directory)
 
 
 @pytest.fixture(autouse=True)  # Autouse for safety reasons
@@ -3,16 +3,16 @@ import pytest
 from thenewboston_node.business_logic import models
 from thenewboston_node.business_logic.models.account_state import AccountState
 from thenewboston_node.business_logic.models.blockchain_state import BlockchainState
+from thenewboston_node.business_logic.tests.fixtures.network import make_node
 from thenewboston_node.business_logic.utils.blockchain_state import BlockchainStateBuilder
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def treasury_initial_balance():
     return 281474976710656
 
 
-@pytest.fixture
-def blockchain_genesis_state(
+def make_test_blockchain_genesis_state(
     treasury_account_key_pair, treasury_initial_balance, primary_validator, confirmation_validator
 ) -> BlockchainState:
     builder = BlockchainStateBuilder()
@@ -27,6 +27,34 @@ def blockchain_genesis_state(
     return state
 
 
+@pytest.fixture
+def blockchain_genesis_state(
+    treasury_account_key_pair, treasury_initial_balance, primary_validator, confirmation_validator
+) -> BlockchainState:
+    return make_test_blockchain_genesis_state(
+        treasury_account_key_pair, treasury_initial_balance, primary_validator, confirmation_validator
+    )
+
+
+@pytest.fixture(scope='module')
+def shared_blockchain_genesis_state(
+    treasury_account_key_pair,
+    treasury_initial_balance,
+    primary_validator_key_pair,
+    pv_network_address,
+    pv_fee_amount,
+    confirmation_validator_key_pair,
+    cv_network_address,
+    cv_fee_amount,
+) -> BlockchainState:
+    return make_test_blockchain_genesis_state(
+        treasury_account_key_pair,
+        treasury_initial_balance,
+        primary_validator=make_node(primary_validator_key_pair, pv_network_address, pv_fee_amount),
+        confirmation_validator=make_node(confirmation_validator_key_pair, cv_network_address, cv_fee_amount),
+    )
+
+
 @pytest.fixture
 def blockchain_genesis_state_dict(blockchain_genesis_state: BlockchainState) -> dict:
     # TODO(dmu) LOW: Consider using serialize_to_dict() instead
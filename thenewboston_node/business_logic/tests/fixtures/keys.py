@@ -28,7 +28,7 @@ def another_node_key_pair() -> KeyPair:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def primary_validator_key_pair() -> KeyPair:
     return KeyPair(
         public=hexstr('b9dc49411424cce606d27eeaa8d74cb84826d8a1001d17603638b73bdc6077f1'),
@@ -36,7 +36,7 @@ def primary_validator_key_pair() -> KeyPair:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def confirmation_validator_key_pair() -> KeyPair:
     return KeyPair(
         public=hexstr('0c838f7f50020ea586b2cd26b4f3cc7b5b399161af43e584f0cc3110952e3c05'),
@@ -44,7 +44,7 @@ def confirmation_validator_key_pair() -> KeyPair:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def treasury_account_key_pair() -> KeyPair:
     return KeyPair(
         public=hexstr('4d3cf1d9e4547d324de2084b568f807ef12045075a7a01b8bec1e7f013fc3732'),
@@ -4,50 +4,46 @@ from thenewboston_node.business_logic.models.node import Node
 from thenewboston_node.business_logic.tests.baker_factories import baker
 
 
-@pytest.fixture
+def make_node(key_pair, network_address, fee_amount):
+    node = baker.make(
+        Node,
+        identifier=key_pair.public,
+        network_addresses=[network_address],
+        fee_amount=fee_amount,
+        fee_account=None,
+    )
+    node._test_key_pair = key_pair
+    return node
+
+
+@pytest.fixture(scope='session')
 def pv_network_address():
     return 'http://pv.non-existing-domain:8555/'
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def pv_fee_amount():
     return 4
 
 
 @pytest.fixture
 def primary_validator(primary_validator_key_pair, pv_network_address, pv_fee_amount):
-    pv = baker.make(
-        Node,
-        identifier=primary_validator_key_pair.public,
-        network_addresses=[pv_network_address],
-        fee_amount=pv_fee_amount,
-        fee_account=None,
-    )
-    pv._test_key_pair = primary_validator_key_pair
-    return pv
+    return make_node(primary_validator_key_pair, pv_network_address, pv_fee_amount)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def cv_network_address():
     return 'http://cv.non-existing-domain:8555/'
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def cv_fee_amount():
     return 1
 
 
 @pytest.fixture
 def confirmation_validator(confirmation_validator_key_pair, cv_network_address, cv_fee_amount):
-    pv = baker.make(
-        Node,
-        identifier=confirmation_validator_key_pair.public,
-        network_addresses=[cv_network_address],
-        fee_amount=cv_fee_amount,
-        fee_account=None,
-    )
-    pv._test_key_pair = confirmation_validator_key_pair
-    return pv
+    return make_node(confirmation_validator_key_pair, cv_network_address, cv_fee_amount)
 
 
 @pytest.fixture
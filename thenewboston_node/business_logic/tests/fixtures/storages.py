@@ -51,6 +51,11 @@ def blockchain_directory2():
     yield from yield_blockchain_directory(f'/tmp/for-thenewboston-blockchain-testing-{os.getpid()}-2')
 
 
+@pytest.fixture(scope='module')
+def shared_blockchain_directory():
+    yield from yield_blockchain_directory(f'/tmp/for-thenewboston-blockchain-testing-{os.getpid()}-shared')
+
+
 @pytest.fixture
 def blockchain_path(blockchain_directory):
     return Path(blockchain_directory)
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 
 from thenewboston_node.business_logic.models import (
     AccountState, Block, BlockMessage, Node, PrimaryValidatorSchedule, SignedChangeRequest, SignedChangeRequestMessage
@@ -13,6 +14,13 @@ def test_get_nested_models():
     }
 
 
+def test_get_nested_models_excludes_self_by_default():
+    nested_models = Block.get_nested_models()
+    assert isinstance(nested_models, tuple)
+    assert Block not in nested_models
+    assert nested_models == Block.get_nested_models(include_self=True)[1:]
+
+
 def test_get_field_docstring():
 
     @dataclass
@@ -24,3 +32,20 @@ def test_get_field_docstring():
 
     assert TestDataclass.get_field_docstring('field_with_explicit_docstring') == 'A docstring'
     assert TestDataclass.get_field_docstring('field_with_implicit_docstring') == 'Field with implicit docstring'
+
+
+def test_get_field_example_value_serializes_nested_datetime():
+
+    @dataclass
+    class TestDataclass(DocumentableMixin):
+        field_with_datetime: datetime = field(metadata={'example_value': datetime(2021, 6, 20, 12, 41, 2)})
+        field_with_nested_datetime: dict = field(
+            metadata={'example_value': {
+                'timestamps': [datetime(2021, 6, 20, 12, 41, 2)]
+            }}
+        )
+
+    assert TestDataclass.get_field_example_value('field_with_datetime') == '"2021-06-20T12:41:02"'
+    assert TestDataclass.get_field_example_value(
+        'field_with_nested_datetime'
+    ) == '{"timestamps": ["2021-06-20T12:41:02"]}'